@@ -11,119 +11,139 @@ from fastapi.responses import RedirectResponse
 import os
 from pathlib import Path
 
-app = FastAPI(title="Mergington High School API",
-              description="API for viewing and signing up for extracurricular activities")
-
-# Mount the static files directory
-current_dir = Path(__file__).parent
-app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
-          "static")), name="static")
-
-# In-memory activity database
-activities = {
-    "Chess Club": {
-        "description": "Learn strategies and compete in chess tournaments",
-        "schedule": "Fridays, 3:30 PM - 5:00 PM",
-        "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-    },
-    "Programming Class": {
-        "description": "Learn programming fundamentals and build software projects",
-        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-        "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-    },
-    "Gym Class": {
-        "description": "Physical education and sports activities",
-        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-        "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-    },
-    # Sports related activities
-    "Soccer Team": {
-        "description": "Join the school soccer team and compete in matches",
-        "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
-        "max_participants": 22,
-        "participants": ["lucas@mergington.edu", "mia@mergington.edu"]
-    },
-    "Basketball Club": {
-        "description": "Practice basketball skills and play friendly games",
-        "schedule": "Mondays, 3:30 PM - 5:00 PM",
-        "max_participants": 15,
-        "participants": ["liam@mergington.edu", "ava@mergington.edu"]
-    },
-    # Artistic activities
-    "Art Workshop": {
-        "description": "Explore painting, drawing, and sculpture techniques",
-        "schedule": "Thursdays, 4:00 PM - 5:30 PM",
-        "max_participants": 18,
-        "participants": ["ella@mergington.edu", "noah@mergington.edu"]
-    },
-    "Drama Club": {
-        "description": "Act, direct, and produce school plays and performances",
-        "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-        "max_participants": 20,
-        "participants": ["isabella@mergington.edu", "jack@mergington.edu"]
-    },
-    # Intellectual activities
-    "Math Olympiad": {
-        "description": "Prepare for math competitions and solve challenging problems",
-        "schedule": "Fridays, 4:00 PM - 5:30 PM",
-        "max_participants": 16,
-        "participants": ["ethan@mergington.edu", "chloe@mergington.edu"]
-    },
-    "Science Club": {
-        "description": "Conduct experiments and explore scientific concepts",
-        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-        "max_participants": 20,
-        "participants": ["benjamin@mergington.edu", "zoe@mergington.edu"]
+
+def _initial_activities():
+    """Build a fresh in-memory activity database"""
+    return {
+        "Chess Club": {
+            "description": "Learn strategies and compete in chess tournaments",
+            "schedule": "Fridays, 3:30 PM - 5:00 PM",
+            "max_participants": 12,
+            "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
+        },
+        "Programming Class": {
+            "description": "Learn programming fundamentals and build software projects",
+            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+            "max_participants": 20,
+            "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
+        },
+        "Gym Class": {
+            "description": "Physical education and sports activities",
+            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+            "max_participants": 30,
+            "participants": {"john@mergington.edu", "olivia@mergington.edu"}
+        },
+        # Sports related activities
+        "Soccer Team": {
+            "description": "Join the school soccer team and compete in matches",
+            "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
+            "max_participants": 22,
+            "participants": {"lucas@mergington.edu", "mia@mergington.edu"}
+        },
+        "Basketball Club": {
+            "description": "Practice basketball skills and play friendly games",
+            "schedule": "Mondays, 3:30 PM - 5:00 PM",
+            "max_participants": 15,
+            "participants": {"liam@mergington.edu", "ava@mergington.edu"}
+        },
+        # Artistic activities
+        "Art Workshop": {
+            "description": "Explore painting, drawing, and sculpture techniques",
+            "schedule": "Thursdays, 4:00 PM - 5:30 PM",
+            "max_participants": 18,
+            "participants": {"ella@mergington.edu", "noah@mergington.edu"}
+        },
+        "Drama Club": {
+            "description": "Act, direct, and produce school plays and performances",
+            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
+            "max_participants": 20,
+            "participants": {"isabella@mergington.edu", "jack@mergington.edu"}
+        },
+        # Intellectual activities
+        "Math Olympiad": {
+            "description": "Prepare for math competitions and solve challenging problems",
+            "schedule": "Fridays, 4:00 PM - 5:30 PM",
+            "max_participants": 16,
+            "participants": {"ethan@mergington.edu", "chloe@mergington.edu"}
+        },
+        "Science Club": {
+            "description": "Conduct experiments and explore scientific concepts",
+            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+            "max_participants": 20,
+            "participants": {"benjamin@mergington.edu", "zoe@mergington.edu"}
+        }
     }
-}
 
 
-@app.get("/")
-def root():
-    return RedirectResponse(url="/static/index.html")
+def create_app():
+    """Create a FastAPI app with its own in-memory activity store.
+
+    Returns the app together with its store so callers (e.g. tests or
+    parallel test workers) can inspect and reset state without sharing it
+    with any other app instance.
+    """
+    app = FastAPI(title="Mergington High School API",
+                  description="API for viewing and signing up for extracurricular activities")
+
+    # Mount the static files directory
+    app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
+              "static")), name="static")
+
+    # In-memory activity database, private to this app instance
+    activities = _initial_activities()
+
+    @app.get("/")
+    def root():
+        return RedirectResponse(url="/static/index.html")
 
+    @app.get("/activities")
+    def get_activities():
+        # Participants are stored as sets for O(1) membership checks; serialize
+        # them as sorted lists so the JSON shape stays stable for clients
+        return {
+            name: {**activity, "participants": sorted(activity["participants"])}
+            for name, activity in activities.items()
+        }
 
-@app.get("/activities")
-def get_activities():
-    return activities
+    @app.post("/activities/{activity_name}/signup")
+    def signup_for_activity(activity_name: str, email: str):
+        """Sign up a student for an activity"""
+        # Validate activity exists
+        if activity_name not in activities:
+            raise HTTPException(status_code=404, detail="Activity not found")
 
+        # Get the specific activity
+        activity = activities[activity_name]
 
-@app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
-    """Sign up a student for an activity"""
-    # Validate activity exists
-    if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
+        # Validate student is not already signed up
+        if email in activity["participants"]:
+            raise HTTPException(status_code=400, detail="Student is already signed up")
 
-    # Get the specific activity
-    activity = activities[activity_name]
+        # Add student
+        activity["participants"].add(email)
+        return {"message": f"Signed up {email} for {activity_name}"}
 
-    # Validate student is not already signed up
-    if email in activity["participants"]:
-        raise HTTPException(status_code=400, detail="Student is already signed up")
+    @app.delete("/activities/{activity_name}/unregister")
+    def unregister_from_activity(activity_name: str, email: str):
+        """Unregister a student from an activity"""
+        # Validate activity exists
+        if activity_name not in activities:
+            raise HTTPException(status_code=404, detail="Activity not found")
 
-    # Add student
-    activity["participants"].append(email)
-    return {"message": f"Signed up {email} for {activity_name}"}
+        # Get the specific activity
+        activity = activities[activity_name]
 
+        # Validate student is signed up
+        if email not in activity["participants"]:
+            raise HTTPException(status_code=404, detail="Student is not signed up for this activity")
 
-@app.delete("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
-    """Unregister a student from an activity"""
-    # Validate activity exists
-    if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
+        # Remove student
+        activity["participants"].remove(email)
+        return {"message": f"Unregistered {email} from {activity_name}"}
 
-    # Get the specific activity
-    activity = activities[activity_name]
+    return app, activities
 
-    # Validate student is signed up
-    if email not in activity["participants"]:
-        raise HTTPException(status_code=404, detail="Student is not signed up for this activity")
 
-    # Remove student
-    activity["participants"].remove(email)
-    return {"message": f"Unregistered {email} from {activity_name}"}
+# Default application instance served by uvicorn. Each importing process
+# (for example a pytest-xdist worker) gets its own app and store.
+app, activities = create_app()
@@ -2,84 +2,130 @@
 Pytest configuration and fixtures for testing the High School Management System API
 """
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 from src.app import app, activities
 
 
-@pytest.fixture
+# Initial state of the in-memory activity database, built once at import time.
+# Fixtures restore from this template instead of rebuilding the literal per test.
+_ORIGINAL_ACTIVITIES = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+    },
+    "Soccer Team": {
+        "description": "Join the school soccer team and compete in matches",
+        "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 22,
+        "participants": ["lucas@mergington.edu", "mia@mergington.edu"]
+    },
+    "Basketball Club": {
+        "description": "Practice basketball skills and play friendly games",
+        "schedule": "Mondays, 3:30 PM - 5:00 PM",
+        "max_participants": 15,
+        "participants": ["liam@mergington.edu", "ava@mergington.edu"]
+    },
+    "Art Workshop": {
+        "description": "Explore painting, drawing, and sculpture techniques",
+        "schedule": "Thursdays, 4:00 PM - 5:30 PM",
+        "max_participants": 18,
+        "participants": ["ella@mergington.edu", "noah@mergington.edu"]
+    },
+    "Drama Club": {
+        "description": "Act, direct, and produce school plays and performances",
+        "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 20,
+        "participants": ["isabella@mergington.edu", "jack@mergington.edu"]
+    },
+    "Math Olympiad": {
+        "description": "Prepare for math competitions and solve challenging problems",
+        "schedule": "Fridays, 4:00 PM - 5:30 PM",
+        "max_participants": 16,
+        "participants": ["ethan@mergington.edu", "chloe@mergington.edu"]
+    },
+    "Science Club": {
+        "description": "Conduct experiments and explore scientific concepts",
+        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 20,
+        "participants": ["benjamin@mergington.edu", "zoe@mergington.edu"]
+    }
+}
+
+
+def _fresh_activities():
+    """Shallow-copy the template with fresh participants sets.
+
+    The description/schedule strings are immutable and can be shared; only
+    the participants are mutated by the API, so only they need copying. The
+    app stores participants as sets, so the template lists are converted here.
+    """
+    return {
+        name: {**activity, "participants": set(activity["participants"])}
+        for name, activity in _ORIGINAL_ACTIVITIES.items()
+    }
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _seed_activities():
+    """Seed the activity database once for the whole test session"""
+    activities.clear()
+    activities.update(_fresh_activities())
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+    """Create a single test client shared across the whole test session"""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run anyio-marked tests on asyncio only"""
+    return "asyncio"
+
+
+@pytest.fixture
+async def aclient():
+    """Async test client for firing independent requests concurrently"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as aclient:
+        yield aclient
+
+
+@pytest.fixture(scope="module")
+def activities_data(client):
+    """Fetch /activities once per module for read-only structural assertions"""
+    return client.get("/activities").json()
 
 
 @pytest.fixture
 def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original state
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Soccer Team": {
-            "description": "Join the school soccer team and compete in matches",
-            "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 22,
-            "participants": ["lucas@mergington.edu", "mia@mergington.edu"]
-        },
-        "Basketball Club": {
-            "description": "Practice basketball skills and play friendly games",
-            "schedule": "Mondays, 3:30 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": ["liam@mergington.edu", "ava@mergington.edu"]
-        },
-        "Art Workshop": {
-            "description": "Explore painting, drawing, and sculpture techniques",
-            "schedule": "Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 18,
-            "participants": ["ella@mergington.edu", "noah@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Act, direct, and produce school plays and performances",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": ["isabella@mergington.edu", "jack@mergington.edu"]
-        },
-        "Math Olympiad": {
-            "description": "Prepare for math competitions and solve challenging problems",
-            "schedule": "Fridays, 4:00 PM - 5:30 PM",
-            "max_participants": 16,
-            "participants": ["ethan@mergington.edu", "chloe@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Conduct experiments and explore scientific concepts",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": ["benjamin@mergington.edu", "zoe@mergington.edu"]
-        }
-    }
-    
-    # Reset activities before test
-    activities.clear()
-    activities.update(original_activities)
-    
+    """Restore participants sets around a test that mutates them.
+
+    Only the participants sets are ever modified by the API, so restoring
+    them is enough; the rest of each activity dict is left untouched. Tests
+    that only read activities don't need this fixture at all.
+    """
     yield
-    
-    # Reset activities after test
-    activities.clear()
-    activities.update(original_activities)
+
+    # Restore participants after the test; the session seed plus every
+    # mutating test restoring on teardown keeps setup-time resets redundant.
+    for name, activity in _ORIGINAL_ACTIVITIES.items():
+        activities[name]["participants"] = set(activity["participants"])
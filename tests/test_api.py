@@ -2,9 +2,31 @@
 Tests for the High School Management System API endpoints
 """
 
+import asyncio
+from urllib.parse import quote
+
 import pytest
 from fastapi import status
 
+from src.app import activities
+
+# URL-quoted activity names, computed once so tests don't rebuild them per call
+_QUOTED = {name: quote(name) for name in activities}
+
+# Activity names the API is expected to serve, as a frozenset so presence
+# checks are a single hashed subset test
+_EXPECTED_ACTIVITIES = frozenset({
+    "Chess Club",
+    "Programming Class",
+    "Gym Class",
+    "Soccer Team",
+    "Basketball Club",
+    "Art Workshop",
+    "Drama Club",
+    "Math Olympiad",
+    "Science Club",
+})
+
 
 class TestRootEndpoint:
     """Tests for the root endpoint"""
@@ -19,64 +41,38 @@ class TestRootEndpoint:
 class TestGetActivities:
     """Tests for the GET /activities endpoint"""
     
-    def test_get_activities_returns_200(self, client, reset_activities):
+    def test_get_activities_returns_200(self, client):
         """Test that getting activities returns 200 OK"""
         response = client.get("/activities")
         assert response.status_code == status.HTTP_200_OK
     
-    def test_get_activities_returns_dict(self, client, reset_activities):
+    def test_get_activities_returns_dict(self, activities_data):
         """Test that getting activities returns a dictionary"""
-        response = client.get("/activities")
-        data = response.json()
-        assert isinstance(data, dict)
-    
-    def test_get_activities_contains_expected_activities(self, client, reset_activities):
-        """Test that the response contains expected activities"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        expected_activities = [
-            "Chess Club",
-            "Programming Class",
-            "Gym Class",
-            "Soccer Team",
-            "Basketball Club",
-            "Art Workshop",
-            "Drama Club",
-            "Math Olympiad",
-            "Science Club"
-        ]
-        
-        for activity in expected_activities:
-            assert activity in data
-    
-    def test_activity_has_required_fields(self, client, reset_activities):
-        """Test that each activity has required fields"""
-        response = client.get("/activities")
-        data = response.json()
-        
+        assert isinstance(activities_data, dict)
+
+    def test_activities_have_expected_structure(self, activities_data):
+        """Test expected activities are present with required fields and list participants"""
+        data = activities_data
+
+        assert _EXPECTED_ACTIVITIES <= data.keys()
+
         required_fields = ["description", "schedule", "max_participants", "participants"]
-        
+
         for activity_name, activity_data in data.items():
             for field in required_fields:
                 assert field in activity_data, f"{activity_name} missing {field}"
-    
-    def test_participants_is_list(self, client, reset_activities):
-        """Test that participants field is a list"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        for activity_name, activity_data in data.items():
             assert isinstance(activity_data["participants"], list)
 
 
 class TestSignupForActivity:
     """Tests for the POST /activities/{activity_name}/signup endpoint"""
+
+    SIGNUP_URL = f"/activities/{_QUOTED['Chess Club']}/signup"
     
     def test_signup_for_existing_activity_success(self, client, reset_activities):
         """Test successful signup for an existing activity"""
         response = client.post(
-            "/activities/Chess%20Club/signup?email=newstudent@mergington.edu"
+            self.SIGNUP_URL, params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == status.HTTP_200_OK
         
@@ -88,17 +84,16 @@ class TestSignupForActivity:
     def test_signup_adds_participant(self, client, reset_activities):
         """Test that signup actually adds the participant to the activity"""
         email = "newstudent@mergington.edu"
-        client.post(f"/activities/Chess%20Club/signup?email={email}")
-        
-        # Verify participant was added
-        response = client.get("/activities")
-        data = response.json()
-        assert email in data["Chess Club"]["participants"]
+        client.post(self.SIGNUP_URL, params={"email": email})
+
+        # Verify participant was added; the client runs in-process, so the
+        # store is already updated and no verification GET is needed
+        assert email in activities["Chess Club"]["participants"]
     
     def test_signup_for_nonexistent_activity_fails(self, client, reset_activities):
         """Test that signing up for non-existent activity returns 404"""
         response = client.post(
-            "/activities/Nonexistent%20Club/signup?email=student@mergington.edu"
+            "/activities/Nonexistent%20Club/signup", params={"email": "student@mergington.edu"}
         )
         assert response.status_code == status.HTTP_404_NOT_FOUND
         
@@ -110,38 +105,53 @@ class TestSignupForActivity:
         """Test that signing up twice for same activity fails"""
         email = "michael@mergington.edu"  # Already in Chess Club
         
-        response = client.post(f"/activities/Chess%20Club/signup?email={email}")
+        response = client.post(self.SIGNUP_URL, params={"email": email})
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         
         data = response.json()
         assert "detail" in data
         assert "already signed up" in data["detail"].lower()
     
-    def test_signup_multiple_students(self, client, reset_activities):
-        """Test signing up multiple students to the same activity"""
-        emails = ["student1@mergington.edu", "student2@mergington.edu", "student3@mergington.edu"]
-        
-        for email in emails:
-            response = client.post(f"/activities/Chess%20Club/signup?email={email}")
+    @pytest.mark.parametrize("email", [
+        "student1@mergington.edu",
+        "student2@mergington.edu",
+        "student3@mergington.edu",
+    ])
+    def test_signup_multiple_students(self, client, reset_activities, email):
+        """Test signing up each of several students to the same activity"""
+        response = client.post(self.SIGNUP_URL, params={"email": email})
+        assert response.status_code == status.HTTP_200_OK
+
+        # Verify the student was added
+        assert email in activities["Chess Club"]["participants"]
+
+    @pytest.mark.anyio
+    async def test_concurrent_signups(self, aclient, reset_activities):
+        """Test that concurrent signups for different students all succeed"""
+        emails = [f"concurrent{i}@mergington.edu" for i in range(3)]
+
+        responses = await asyncio.gather(*[
+            aclient.post(self.SIGNUP_URL, params={"email": email})
+            for email in emails
+        ])
+
+        for response in responses:
             assert response.status_code == status.HTTP_200_OK
-        
-        # Verify all students were added
-        response = client.get("/activities")
-        data = response.json()
-        
         for email in emails:
-            assert email in data["Chess Club"]["participants"]
+            assert email in activities["Chess Club"]["participants"]
 
 
 class TestUnregisterFromActivity:
     """Tests for the DELETE /activities/{activity_name}/unregister endpoint"""
+
+    UNREGISTER_URL = f"/activities/{_QUOTED['Chess Club']}/unregister"
     
     def test_unregister_existing_participant_success(self, client, reset_activities):
         """Test successful unregistration of an existing participant"""
         email = "michael@mergington.edu"  # Already in Chess Club
         
         response = client.delete(
-            f"/activities/Chess%20Club/unregister?email={email}"
+            self.UNREGISTER_URL, params={"email": email}
         )
         assert response.status_code == status.HTTP_200_OK
         
@@ -155,17 +165,15 @@ class TestUnregisterFromActivity:
         email = "michael@mergington.edu"  # Already in Chess Club
         
         # Unregister the participant
-        client.delete(f"/activities/Chess%20Club/unregister?email={email}")
-        
+        client.delete(self.UNREGISTER_URL, params={"email": email})
+
         # Verify participant was removed
-        response = client.get("/activities")
-        data = response.json()
-        assert email not in data["Chess Club"]["participants"]
+        assert email not in activities["Chess Club"]["participants"]
     
     def test_unregister_from_nonexistent_activity_fails(self, client, reset_activities):
         """Test that unregistering from non-existent activity returns 404"""
         response = client.delete(
-            "/activities/Nonexistent%20Club/unregister?email=student@mergington.edu"
+            "/activities/Nonexistent%20Club/unregister", params={"email": "student@mergington.edu"}
         )
         assert response.status_code == status.HTTP_404_NOT_FOUND
         
@@ -177,86 +185,42 @@ class TestUnregisterFromActivity:
         """Test that unregistering a non-participant returns 404"""
         email = "notregistered@mergington.edu"
         
-        response = client.delete(f"/activities/Chess%20Club/unregister?email={email}")
+        response = client.delete(self.UNREGISTER_URL, params={"email": email})
         assert response.status_code == status.HTTP_404_NOT_FOUND
         
         data = response.json()
         assert "detail" in data
         assert "not signed up" in data["detail"].lower()
-    
-    def test_signup_and_unregister_workflow(self, client, reset_activities):
-        """Test complete workflow of signing up and then unregistering"""
-        email = "workflow@mergington.edu"
-        activity = "Chess Club"
-        
-        # Sign up
-        signup_response = client.post(f"/activities/{activity.replace(' ', '%20')}/signup?email={email}")
-        assert signup_response.status_code == status.HTTP_200_OK
-        
-        # Verify signup
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
-        
-        # Unregister
-        unregister_response = client.delete(f"/activities/{activity.replace(' ', '%20')}/unregister?email={email}")
-        assert unregister_response.status_code == status.HTTP_200_OK
-        
-        # Verify unregistration
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity]["participants"]
 
 
 class TestActivityManagement:
     """Integration tests for activity management"""
     
-    def test_multiple_activities_independent(self, client, reset_activities):
-        """Test that operations on different activities are independent"""
+    @pytest.mark.parametrize("activity", ["Chess Club", "Programming Class", "Gym Class"])
+    def test_multiple_activities_independent(self, client, reset_activities, activity):
+        """Test that signing up for one activity does not affect the others"""
         email = "multitask@mergington.edu"
-        
-        # Sign up for multiple activities
-        activities_to_join = ["Chess Club", "Programming Class", "Gym Class"]
-        
-        for activity in activities_to_join:
-            response = client.post(f"/activities/{activity.replace(' ', '%20')}/signup?email={email}")
-            assert response.status_code == status.HTTP_200_OK
-        
-        # Verify all signups
-        response = client.get("/activities")
-        data = response.json()
-        
-        for activity in activities_to_join:
-            assert email in data[activity]["participants"]
-        
-        # Unregister from one
-        client.delete(f"/activities/Chess%20Club/unregister?email={email}")
-        
-        # Verify only one was affected
-        response = client.get("/activities")
-        data = response.json()
-        
-        assert email not in data["Chess Club"]["participants"]
-        assert email in data["Programming Class"]["participants"]
-        assert email in data["Gym Class"]["participants"]
-    
-    def test_participant_count_accuracy(self, client, reset_activities):
-        """Test that participant counts are accurate"""
-        response = client.get("/activities")
-        initial_data = response.json()
-        
-        initial_count = len(initial_data["Chess Club"]["participants"])
-        
-        # Add a participant
-        client.post("/activities/Chess%20Club/signup?email=counter@mergington.edu")
-        
-        response = client.get("/activities")
-        data = response.json()
-        assert len(data["Chess Club"]["participants"]) == initial_count + 1
-        
-        # Remove a participant
-        client.delete("/activities/Chess%20Club/unregister?email=counter@mergington.edu")
-        
-        response = client.get("/activities")
-        data = response.json()
-        assert len(data["Chess Club"]["participants"]) == initial_count
+
+        response = client.post(f"/activities/{_QUOTED[activity]}/signup", params={"email": email})
+        assert response.status_code == status.HTTP_200_OK
+
+        # Verify the signup landed only in the targeted activity
+        assert email in activities[activity]["participants"]
+        for other_name, other_data in activities.items():
+            if other_name != activity:
+                assert email not in other_data["participants"]
+    
+    @pytest.mark.parametrize("method, action, email, expected_delta", [
+        ("post", "signup", "counter@mergington.edu", 1),
+        ("delete", "unregister", "michael@mergington.edu", -1),
+    ])
+    def test_participant_count_accuracy(self, client, reset_activities,
+                                        method, action, email, expected_delta):
+        """Test that a single signup/unregister changes the count by one"""
+        initial_count = len(activities["Chess Club"]["participants"])
+
+        response = getattr(client, method)(
+            f"/activities/{_QUOTED['Chess Club']}/{action}", params={"email": email}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert len(activities["Chess Club"]["participants"]) == initial_count + expected_delta